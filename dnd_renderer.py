@@ -5,13 +5,21 @@ This module provides a Python interface to render D&D 5e content from 5etools JS
 to Markdown format, along with metadata extraction for graph/vector databases.
 """
 
+import os
 import subprocess
 import json
 import shutil
+import hashlib
+import functools
+import re
+import tarfile
+import tempfile
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 import logging
 
+from renderer_client import RENDERER_MODULES
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,6 +48,44 @@ def find_node() -> str:
 
 NODE_PATH = find_node()
 
+# Summary line printed by the renderer for each file, e.g. "Completed: 20 succeeded, 0 errors"
+_COMPLETED_RE = re.compile(r"Completed:\s+(\d+)\s+\S+\s+(\d+)")
+
+# Name of the stats file stored alongside the rendered output in each cache tarball
+CACHE_STATS_FILE = '.render_stats.json'
+
+# Safe extraction filter where tarfile supports it (3.12, and security backports before that)
+_EXTRACT_FILTER = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_renderer(renderer_path: Optional[str]) -> Tuple[Path, Path, bytes]:
+    """
+    Resolve the renderer directory, script and renderer version once per distinct path.
+
+    Rendering is deterministic for a given script and set of 5etools modules, so a hash
+    of all of them versions the render cache.
+    """
+    if renderer_path is None:
+        renderer_path = Path(__file__).parent
+
+    renderer_path = Path(renderer_path).resolve()
+    script = renderer_path / "render-to-markdown.js"
+
+    if not script.exists():
+        raise FileNotFoundError(
+            f"Renderer script not found at {script}. "
+            f"Make sure the 5etools-src directory is properly set up."
+        )
+
+    digest = hashlib.blake2b(script.read_bytes())
+    for module in RENDERER_MODULES:
+        module_path = renderer_path / module
+        if module_path.exists():
+            digest.update(module_path.read_bytes())
+
+    return renderer_path, script, digest.digest()
+
 
 class DnDRenderer:
     """
@@ -59,73 +105,166 @@ class DnDRenderer:
             renderer_path: Path to the renderer directory containing render-to-markdown.js.
                           Defaults to current directory (where this file is located).
         """
-        if renderer_path is None:
-            renderer_path = Path(__file__).parent
-
-        self.renderer_path = Path(renderer_path).resolve()
-        self.script = self.renderer_path / "render-to-markdown.js"
+        self.renderer_path, self.script, self.renderer_version = _resolve_renderer(renderer_path)
         self.node_path = NODE_PATH
+        self.cache_dir = self.renderer_path / ".render_cache"
+        self._list_cache: Optional[List[str]] = None
 
-        if not self.script.exists():
-            raise FileNotFoundError(
-                f"Renderer script not found at {self.script}. "
-                f"Make sure the 5etools-src directory is properly set up."
-            )
-
-        logger.info(f"Using node: {self.node_path}")
+        logger.info("Using node: %s", self.node_path)
 
     def list_data_files(self) -> List[str]:
-        """List available D&D data files."""
-        result = subprocess.run(
-            [self.node_path, str(self.script), "--list"],
-            cwd=str(self.renderer_path),
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        """
+        List available D&D data files.
+
+        The listing is fetched from Node once and reused; call refresh_listing()
+        after adding or removing data files.
+        """
+        if self._list_cache is not None:
+            return self._list_cache
 
-        lines = result.stdout.strip().split('\n')
-        files = [line.strip().replace('- ', '') for line in lines if line.strip().startswith('-')]
-        return files
+        lines = self._stream(["--list"])
+        self._list_cache = [line.strip().replace('- ', '') for line in lines if line.strip().startswith('-')]
+        return self._list_cache
+
+    def refresh_listing(self) -> None:
+        """Forget the cached data file listing so the next call asks Node again."""
+        self._list_cache = None
+
+    def render_file(
+        self,
+        input_file: str,
+        output_dir: str,
+        verbose: bool = True,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Render a single D&D JSON file to markdown.
 
-    def render_file(self, input_file: str, output_dir: str, verbose: bool = True) -> Dict[str, Any]:
-        """Render a single D&D JSON file to markdown."""
+        With use_cache, the rendered files are stored in .render_cache/ as a tarball
+        keyed by the input contents and renderer version; unchanged inputs are
+        restored from there instead of being sent to Node again.
+        """
         input_path = self._resolve_path(input_file)
         output_path = Path(output_dir).resolve()
 
-        logger.info(f"Rendering {input_path} to {output_path}")
+        logger.info("Rendering %s to %s", input_path, output_path)
 
-        result = subprocess.run(
-            [self.node_path, str(self.script), "--input", str(input_path), "--output-dir", str(output_path)],
-            cwd=str(self.renderer_path),
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        if not use_cache:
+            return self._render(input_path, output_path, verbose)
+
+        cache_file = self.cache_dir / f"{self._cache_key(input_path)}.tar"
 
-        if verbose:
-            print(result.stdout)
+        if cache_file.exists():
+            logger.info("Cache hit for %s", input_path)
+        else:
+            self._render_to_cache(input_path, cache_file, verbose)
+
+        with tarfile.open(cache_file) as tar:
+            stats = json.load(tar.extractfile(f"./{CACHE_STATS_FILE}"))
+            # Skip the stats file, and the '.' root entry older tarballs carry, which would
+            # otherwise stamp the scratch directory's mode and mtime onto output_path
+            members = [m for m in tar.getmembers() if m.name not in ('.', f"./{CACHE_STATS_FILE}")]
+            tar.extractall(output_path, members=members, **_EXTRACT_FILTER)
+
+        stats['output_dir'] = str(output_path)
+        return stats
 
-        stats = self._parse_output(result.stdout)
+    def _render(self, input_path: Path, output_path: Path, verbose: bool) -> Dict[str, Any]:
+        """Run the Node renderer on input_path, writing into output_path."""
+        stats = self._run_render(["--input", str(input_path), "--output-dir", str(output_path)], verbose)
         stats['output_dir'] = str(output_path)
         return stats
 
+    def _run_render(self, args: List[str], verbose: bool) -> Dict[str, Any]:
+        """Run a render command, echoing its output as it arrives and tallying stats."""
+        stats = {'success_count': 0, 'error_count': 0}
+        for line in self._stream(args):
+            if verbose:
+                print(line)
+            if 'Completed:' in line:
+                self._parse_output(line, stats)
+        return stats
+
+    def _render_to_cache(self, input_path: Path, cache_file: Path, verbose: bool) -> None:
+        """Render into a scratch directory and pack the result into cache_file."""
+        self.cache_dir.mkdir(exist_ok=True)
+
+        with tempfile.TemporaryDirectory(dir=self.cache_dir) as scratch:
+            stats = self._render(input_path, Path(scratch), verbose)
+            del stats['output_dir']
+            (Path(scratch) / CACHE_STATS_FILE).write_text(json.dumps(stats))
+
+            # Pack under a temporary name so readers never see a partial tarball
+            # (unique per call, so concurrent renders of the same input don't share one)
+            fd, partial = tempfile.mkstemp(dir=self.cache_dir, suffix='.partial')
+            try:
+                with open(fd, 'wb') as partial_file, tarfile.open(fileobj=partial_file, mode='w') as tar:
+                    for child in Path(scratch).iterdir():
+                        tar.add(child, arcname=f"./{child.name}")
+                Path(partial).replace(cache_file)
+            except BaseException:
+                os.unlink(partial)
+                raise
+
+    def _cache_key(self, input_path: Path) -> str:
+        """Hash the input file contents together with the renderer version."""
+        digest = hashlib.blake2b(self.renderer_version, digest_size=16)
+        digest.update(input_path.read_bytes())
+        return digest.hexdigest()
+
+    def _stream(self, args: List[str]) -> Iterator[str]:
+        """
+        Run render-to-markdown.js with args and yield its output line by line.
+
+        Lines are yielded as they arrive, so output is never buffered in full.
+        Raises CalledProcessError (with the script's stderr) if it exits non-zero.
+        """
+        command = [self.node_path, str(self.script), *args]
+
+        # stderr goes to a file so a chatty script can't block on a full pipe
+        # while stdout is being read.
+        # subprocess only launches via posix_spawn (instead of fork + exec) when no cwd
+        # is given and close_fds is off, so cwd is passed only when it actually changes.
+        # Python's own fds are non-inheritable by default, so close_fds=False leaks nothing.
+        with tempfile.TemporaryFile() as stderr:
+            proc = subprocess.Popen(
+                command,
+                cwd=None if Path.cwd() == self.renderer_path else str(self.renderer_path),
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                text=True,
+                close_fds=False
+            )
+            finished = False
+            try:
+                for line in proc.stdout:
+                    yield line.rstrip('\n')
+                finished = True
+            finally:
+                # Stop the script if the caller abandoned the output early
+                if not finished:
+                    proc.kill()
+                proc.stdout.close()
+                returncode = proc.wait()
+
+            if returncode:
+                stderr.seek(0)
+                raise subprocess.CalledProcessError(
+                    returncode, command, stderr=stderr.read().decode(errors='replace')
+                )
+
     def _resolve_path(self, path: str) -> Path:
         """Resolve path relative to renderer_path or as absolute."""
         path_obj = Path(path)
         return path_obj if path_obj.is_absolute() else (self.renderer_path / path).resolve()
 
-    def _parse_output(self, output: str) -> Dict[str, Any]:
-        """Parse renderer output for statistics."""
-        stats = {'success_count': 0, 'error_count': 0}
-        for line in output.split('\n'):
-            if 'Completed:' in line:
-                try:
-                    parts = line.split()
-                    stats['success_count'] = int(parts[1])
-                    stats['error_count'] = int(parts[3])
-                except (IndexError, ValueError):
-                    pass
+    def _parse_output(self, output: str, stats: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Parse renderer output for statistics, summing over every rendered file (into stats if given)."""
+        if stats is None:
+            stats = {'success_count': 0, 'error_count': 0}
+        for match in _COMPLETED_RE.finditer(output):
+            stats['success_count'] += int(match.group(1))
+            stats['error_count'] += int(match.group(2))
         return stats
 
 
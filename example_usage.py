@@ -4,9 +4,13 @@ Example usage of the D&D Renderer Python wrapper
 This demonstrates how to integrate the renderer into your Agentic DM project.
 """
 
+import re
 from renderer_client import DnDRenderer
 from pathlib import Path
 
+# Matches "fire" as a whole word, case-insensitively, without lowercasing each document
+_FIRE_RE = re.compile(r'\bfire\b', re.IGNORECASE)
+
 
 def example_basic_usage():
     """Basic rendering example"""
@@ -230,7 +234,7 @@ def example_agentic_dm_workflow():
     # For this example, we'll just demonstrate the data structure
     relevant_spells = [
         spell for spell in spells[:10]  # Limit for demo
-        if 'fire' in spell['markdown'].lower()
+        if _FIRE_RE.search(spell['markdown'])
     ]
 
     print(f"  Query: '{query}'")
@@ -4,20 +4,128 @@ Render all 5etools entries to markdown files
 Saves each entry as an individual file for RAG/embedding purposes
 """
 
+import multiprocessing as mp
+import os
 import time
 from pathlib import Path
 from renderer_client import RenderingClient
+from render_pool import (
+    EntryWriter, FRONTMATTER_END, FRONTMATTER_START, NAME, NEWLINE, PAGE, SOURCE, TYPE,
+    entry_stem, init_worker, worker_client,
+)
+
+# Separator between entries in the combined per-type file (same as the rendering service)
+_COMBINED_SEPARATOR = b'\n\n---\n\n'
+
+# Bytes handed to the kernel per copy call when building the combined file
+_COPY_CHUNK = 1024 * 1024
+
+# Bytes read from the start of an entry file to find the end of its frontmatter
+_FRONTMATTER_PEEK = 4096
+
+
+def _append_file(out_fd, in_fd, offset, size):
+    """Append bytes offset..size of in_fd to out_fd, in-kernel where the platform allows it"""
+    try:
+        while offset < size:
+            sent = os.sendfile(out_fd, in_fd, offset, min(_COPY_CHUNK, size - offset))
+            if not sent:
+                break
+            offset += sent
+    except OSError:
+        # Some platforms only sendfile to sockets; copy through user space instead
+        os.lseek(in_fd, offset, os.SEEK_SET)
+        while True:
+            chunk = os.read(in_fd, _COPY_CHUNK)
+            if not chunk:
+                break
+            os.write(out_fd, chunk)
+
+
+def _markdown_offset(in_fd):
+    """Offset where the markdown starts in an entry file, just past its frontmatter"""
+    head = os.pread(in_fd, _FRONTMATTER_PEEK, 0)
+    if not head.startswith(FRONTMATTER_START):
+        return 0
+    end = head.find(NEWLINE + FRONTMATTER_END)
+    return end + len(NEWLINE + FRONTMATTER_END) if end != -1 else 0
+
+
+def consolidate(entry_files, combined):
+    """
+    Concatenate the markdown of entry_files, in order, into the single file combined
+
+    Each file's frontmatter is skipped, so the result matches the rendering service's
+    combined file: bare markdown joined by separators.
+    """
+    out_fd = os.open(combined, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        for index, entry_file in enumerate(entry_files):
+            if index:
+                os.write(out_fd, _COMBINED_SEPARATOR)
+
+            in_fd = os.open(entry_file, os.O_RDONLY)
+            try:
+                _append_file(out_fd, in_fd, _markdown_offset(in_fd), os.fstat(in_fd).st_size)
+            finally:
+                os.close(in_fd)
+    finally:
+        os.close(out_fd)
+
+    return combined
+
+
+def _render_one(task):
+    """Render every entry of one entity type and save each to a file (runs in a worker process)"""
+    entity_type, output_path = task
+    type_dir = output_path / entity_type
+
+    start = time.time()
+    try:
+        # Render all entries of this type
+        entries = worker_client().render_type(entity_type, limit=None, save_to_file=False)
+
+        # Format in this thread and hand the writes off to a thread pool
+        with EntryWriter() as writer:
+            # Save each entry to a file
+            for entry in entries:
+                stem = entry_stem(entry)
+
+                metadata = entry.metadata
+                page = metadata.get('page')
+                parts = [
+                    FRONTMATTER_START,
+                    NAME, entry.name.encode(), NEWLINE,
+                    SOURCE, entry.source.encode(), NEWLINE,
+                    TYPE, metadata['type'].encode(), NEWLINE,
+                ]
+                if page is not None:
+                    parts += (PAGE, str(page).encode(), NEWLINE)
+                parts += (FRONTMATTER_END, entry.markdown.encode())
+
+                writer.write(stem, (type_dir / f"{stem}.md", parts))
+
+        # Combined file for consumers that want the whole type at once, in data order.
+        # It lives next to the type directory so globbing the entry files doesn't pick it up
+        entry_files = [type_dir / f"{stem}.md" for stem in writer.stems]
+        consolidate(entry_files, output_path / f'_all_{entity_type}s.md')
+
+        return entity_type, len(entries), time.time() - start, None
+
+    except Exception as e:
+        return entity_type, 0, time.time() - start, str(e)
 
 
 def render_all_entries(output_dir='rendered-entries'):
     """Render all entries and save to individual files"""
 
-    client = RenderingClient()
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
 
-    # Get available entity types
-    summary = client.get_data_summary()
+    # Get available entity types; the client (and its Node worker, stderr thread and
+    # cache connection) is closed before the pool forks
+    with RenderingClient() as client:
+        summary = client.get_data_summary()
 
     print('=' * 60)
     print('5etools Markdown Renderer - Render All Entries')
@@ -27,41 +135,33 @@ def render_all_entries(output_dir='rendered-entries'):
     total_start = time.time()
     total_rendered = 0
 
-    for entity_type, info in sorted(summary.items()):
-        count = info['count']
-        print(f'📝 Rendering {entity_type:20} ({count:4} entries)...', end=' ', flush=True)
-
+    tasks = []
+    for entity_type in sorted(summary):
         # Create subdirectory for this type
-        type_dir = output_path / entity_type
-        type_dir.mkdir(exist_ok=True)
-
-        start = time.time()
-        try:
-            # Render all entries of this type
-            entries = client.render_type(entity_type, limit=None, save_to_file=False)
-
-            # Save each entry to a file
-            for entry in entries:
-                # Create safe filename
-                filename = f"{entry.name.replace(' ', '_').replace('/', '_')}_{entry.source}.md"
-                filepath = type_dir / filename
-
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(f'---\n')
-                    f.write(f'name: {entry.name}\n')
-                    f.write(f'source: {entry.source}\n')
-                    f.write(f'type: {entry.metadata["type"]}\n')
-                    if 'page' in entry.metadata:
-                        f.write(f'page: {entry.metadata["page"]}\n')
-                    f.write(f'---\n\n')
-                    f.write(entry.markdown)
-
-            elapsed = time.time() - start
-            total_rendered += len(entries)
-            print(f'✅ {elapsed:.2f}s ({len(entries)/elapsed:.0f} entries/s)')
-
-        except Exception as e:
-            print(f'❌ Error: {e}')
+        (output_path / entity_type).mkdir(exist_ok=True)
+        tasks.append((entity_type, output_path))
+
+    # Entity types are independent, so render them in parallel worker processes, each
+    # with its own client; per-type results are collected and reported together once
+    # everything is done
+    rows = []
+    if tasks:
+        with mp.Pool(min(len(tasks), os.cpu_count() or 1), initializer=init_worker) as pool:
+            rows = sorted(pool.imap_unordered(_render_one, tasks))
+            # Let the workers exit cleanly so their clients shut down their Node workers
+            pool.close()
+            pool.join()
+
+    lines = []
+    for entity_type, count, elapsed, error in rows:
+        if error is not None:
+            lines.append(f'❌ {entity_type:20} Error: {error}')
+            continue
+
+        total_rendered += count
+        lines.append(f'✅ {entity_type:20} {count:5} entries | {elapsed:.2f}s | {count/elapsed:.0f} entries/s')
+
+    print('\n'.join(lines))
 
     total_elapsed = time.time() - total_start
 
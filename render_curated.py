@@ -4,15 +4,135 @@ Render curated D&D 5e rules with metadata extraction
 Processes all filtered_*.json files in curated_rules/ directory
 """
 
+import json
+import multiprocessing as mp
+import os
+import re
 import time
 from pathlib import Path
-from renderer_client import RenderingClient
+from render_pool import (
+    EntryWriter, FRONTMATTER_END, FRONTMATTER_START, NAME, NEWLINE, TYPE,
+    entry_stem, init_worker, worker_client,
+)
 
+try:
+    import orjson
 
-def render_curated_rules(output_dir='curated-output', metadata_dir='curated-metadata'):
-    """Render all curated rules files with metadata"""
+    def _dump_metadata(metadata):
+        return orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+except ImportError:
+    # orjson is optional; with ensure_ascii=False the stdlib encoder writes the same bytes
+    def _dump_metadata(metadata):
+        return json.dumps(metadata, indent=2, ensure_ascii=False).encode()
+
+# First top-level array key of a curated file, which the service uses as its entity type
+_ENTITY_KEY_RE = re.compile(rb'"(\w+)"\s*:\s*\[')
+
+
+def _peek_entity_type(curated_file):
+    """Read the entity type from the start of a curated file without parsing all of it"""
+    with open(curated_file, 'rb') as f:
+        match = _ENTITY_KEY_RE.search(f.read(4096))
+    return match.group(1).decode() if match else None
+
+
+def _stamp_path(curated_file, output_path):
+    """Sentinel file recording the last successful render of a curated file"""
+    return output_path / f'.{curated_file.stem}.stamp'
+
+
+def _up_to_date(curated_file, output_path, metadata_path):
+    """True if the curated file hasn't changed since it was last rendered into both output dirs"""
+    source_mtime = curated_file.stat().st_mtime
+    for stamp in (_stamp_path(curated_file, output_path), _stamp_path(curated_file, metadata_path)):
+        if not stamp.exists() or stamp.stat().st_mtime < source_mtime:
+            return False
+    return True
+
+
+def _write_stamps(curated_file, source_mtime, output_path, metadata_path):
+    """
+    Record a successful render in both output dirs, so deleting either forces a re-render
+
+    The stamps get the curated file's mtime from before the render, so an edit made while
+    it was rendering still leaves the file stale.
+    """
+    for path in (output_path, metadata_path):
+        path.mkdir(parents=True, exist_ok=True)
+        stamp = _stamp_path(curated_file, path)
+        stamp.touch()
+        os.utime(stamp, (source_mtime, source_mtime))
+
+
+def _make_type_dirs(entity_type, output_path, metadata_path):
+    """Create the markdown and metadata directories for one entity type"""
+    (output_path / entity_type).mkdir(parents=True, exist_ok=True)
+    (metadata_path / entity_type).mkdir(parents=True, exist_ok=True)
+
+
+def _render_one(task):
+    """Render one curated file and save its markdown/metadata (runs in a worker process)"""
+    curated_file, expected_type, output_path, metadata_path = task
+
+    start = time.time()
+    try:
+        source_mtime = curated_file.stat().st_mtime
+
+        result = worker_client().render_from_file(
+            str(curated_file),
+            save_to_file=False
+        )
+
+        entity_type = result['entityType']
+        entries = result['results']
+
+        if not entries:
+            # Nothing to write, but still remembered so unchanged files aren't retried every run
+            _write_stamps(curated_file, source_mtime, output_path, metadata_path)
+            return curated_file.name, 0, time.time() - start, None
+
+        # Markdown and metadata go to separate directories per entity type
+        type_dir = output_path / entity_type
+        metadata_type_dir = metadata_path / entity_type
+
+        # Directories are created up front; only a wrong guess needs them made here
+        if entity_type != expected_type:
+            _make_type_dirs(entity_type, output_path, metadata_path)
+
+        # Format in this thread and hand the writes off to a thread pool
+        with EntryWriter() as writer:
+            # Save markdown and metadata files in a single pass
+            for entry in entries:
+                stem = entry_stem(entry)
+
+                writer.write(
+                    stem,
+                    # Minimal frontmatter - just name and type
+                    (type_dir / f"{stem}.md", [
+                        FRONTMATTER_START,
+                        NAME, entry.name.encode(), NEWLINE,
+                        TYPE, entry.metadata['type'].encode(), NEWLINE,
+                        FRONTMATTER_END,
+                        entry.markdown.encode(),
+                    ]),
+                    (metadata_type_dir / f"{stem}.json", [_dump_metadata(entry.metadata)]),
+                )
+
+        _write_stamps(curated_file, source_mtime, output_path, metadata_path)
+
+        return curated_file.name, len(entries), time.time() - start, None
+
+    except Exception as e:
+        return curated_file.name, 0, time.time() - start, str(e)
+
+
+def render_curated_rules(output_dir='curated-output', metadata_dir='curated-metadata', force=False):
+    """Render all curated rules files with metadata
+
+    Files that haven't changed since their last successful render are skipped
+    unless force is set.
+    """
 
-    client = RenderingClient()
     curated_dir = Path('curated_rules')
     output_path = Path(output_dir)
     metadata_path = Path(metadata_dir)
@@ -38,61 +158,47 @@ def render_curated_rules(output_dir='curated-output', metadata_dir='curated-meta
     total_start = time.time()
     total_entries = 0
 
-    for curated_file in curated_files:
-        print(f'📝 Processing {curated_file.name:35}', end=' ', flush=True)
-
-        start = time.time()
-        try:
-            result = client.render_from_file(
-                str(curated_file),
-                save_to_file=False
-            )
+    # Skip files whose outputs are newer than the input
+    if not force:
+        stale_files = []
+        for curated_file in curated_files:
+            if _up_to_date(curated_file, output_path, metadata_path):
+                print(f'📝 Processing {curated_file.name:35} ⏭️  Up to date')
+            else:
+                stale_files.append(curated_file)
+        curated_files = stale_files
 
-            entity_type = result['entityType']
-            entries = result['results']
+    # Create every entity type's output directories once, before any worker starts
+    tasks = [
+        (curated_file, _peek_entity_type(curated_file), output_path, metadata_path)
+        for curated_file in curated_files
+    ]
 
-            if not entries:
-                print('⚠️  No entries found')
-                continue
+    for entity_type in {task[1] for task in tasks if task[1]}:
+        _make_type_dirs(entity_type, output_path, metadata_path)
 
-            # Create output directory for this entity type
-            type_dir = output_path / entity_type
-            type_dir.mkdir(parents=True, exist_ok=True)
+    # Files are independent, so render them in parallel worker processes, each with its own client
+    if tasks:
+        with mp.Pool(min(len(tasks), os.cpu_count() or 1), initializer=init_worker) as pool:
+            for name, count, elapsed, error in pool.imap_unordered(_render_one, tasks):
+                print(f'📝 Processing {name:35}', end=' ')
 
-            # Save markdown files
-            for entry in entries:
-                # Create safe filename
-                filename = f"{entry.name.replace(' ', '_').replace('/', '_')}_{entry.source}.md"
-                filepath = type_dir / filename
-
-                # Minimal frontmatter - just name and type
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(f'---\n')
-                    f.write(f'name: {entry.name}\n')
-                    f.write(f'type: {entry.metadata["type"]}\n')
-                    f.write(f'---\n\n')
-                    f.write(entry.markdown)
-
-            # Save metadata files to separate metadata directory
-            metadata_type_dir = metadata_path / entity_type
-            metadata_type_dir.mkdir(parents=True, exist_ok=True)
-
-            import json
-            for entry in entries:
-                meta_filename = f"{entry.name.replace(' ', '_').replace('/', '_')}_{entry.source}.json"
-                meta_path = metadata_type_dir / meta_filename
+                if error is not None:
+                    print(f'❌ Error: {error}')
+                    continue
 
-                with open(meta_path, 'w', encoding='utf-8') as f:
-                    json.dump(entry.metadata, f, indent=2)
+                if not count:
+                    print('⚠️  No entries found')
+                    continue
 
-            elapsed = time.time() - start
-            rate = len(entries) / elapsed if elapsed > 0 else 0
-            total_entries += len(entries)
+                rate = count / elapsed if elapsed > 0 else 0
+                total_entries += count
 
-            print(f'✅ {len(entries):4} entries | {elapsed:.2f}s | {rate:.0f}/s')
+                print(f'✅ {count:4} entries | {elapsed:.2f}s | {rate:.0f}/s')
 
-        except Exception as e:
-            print(f'❌ Error: {e}')
+            # Let the workers exit cleanly so their clients shut down their Node workers
+            pool.close()
+            pool.join()
 
     total_elapsed = time.time() - total_start
 
@@ -113,4 +219,5 @@ def render_curated_rules(output_dir='curated-output', metadata_dir='curated-meta
 
 
 if __name__ == '__main__':
-    render_curated_rules()
+    import sys
+    render_curated_rules(force='--force' in sys.argv)
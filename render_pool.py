@@ -0,0 +1,103 @@
+"""
+Shared plumbing for render_all.py and render_curated.py
+Each worker process keeps one RenderingClient, and entry files are written on a thread pool
+"""
+
+import multiprocessing as mp
+import multiprocessing.util
+import os
+from concurrent.futures import ThreadPoolExecutor
+from renderer_client import RenderingClient
+
+# Maps characters we don't want in entry filenames to underscores
+_FILENAME_TABLE = str.maketrans({' ': '_', '/': '_'})
+
+# Threads used to overlap per-entry file writes with formatting the next entry
+WRITE_WORKERS = 16
+
+# Pre-encoded frontmatter pieces, written together with one writev per entry
+FRONTMATTER_START = b'---\n'
+FRONTMATTER_END = b'---\n\n'
+NAME = b'name: '
+SOURCE = b'source: '
+TYPE = b'type: '
+PAGE = b'page: '
+NEWLINE = b'\n'
+
+# Client owned by this worker process, started by init_worker and reused for every task
+_client = None
+
+
+def init_worker():
+    """Pool initializer: start the worker process's RenderingClient, closed when the worker exits"""
+    global _client
+    _client = RenderingClient()
+    # Pool workers skip atexit, but run multiprocessing finalizers on a clean exit
+    mp.util.Finalize(_client, _client.close, exitpriority=10)
+
+
+def worker_client():
+    """The RenderingClient started for this worker process by init_worker"""
+    return _client
+
+
+def entry_stem(entry):
+    """Safe filename stem for a rendered entry, shared by all of its output files"""
+    return f"{entry.name.translate(_FILENAME_TABLE)}_{entry.source}"
+
+
+def write_chunks(path, chunks):
+    """Write byte chunks to a file with one open and, normally, one writev"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        index = 0
+        while index < len(chunks):
+            written = os.writev(fd, chunks[index:])
+
+            # writev may write less than asked (e.g. when interrupted); resume after the last byte written
+            while index < len(chunks) and written >= len(chunks[index]):
+                written -= len(chunks[index])
+                index += 1
+            if written:
+                chunks = list(chunks)
+                chunks[index] = memoryview(chunks[index])[written:]
+    finally:
+        os.close(fd)
+
+
+class EntryWriter:
+    """
+    Writes entry files on a thread pool so the caller can format the next entry meanwhile
+
+    Use as a context manager; leaving the block waits for every write and raises the
+    first write error.
+    """
+
+    def __init__(self, max_workers=WRITE_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._executor.shutdown()
+
+        # Surface any write errors
+        if exc_type is None:
+            for futures in self._futures.values():
+                for future in futures:
+                    future.result()
+
+    @property
+    def stems(self):
+        """Stems written so far, in the order their entries were first seen"""
+        return list(self._futures)
+
+    def write(self, stem, *files):
+        """Queue the (path, chunks) files of one entry"""
+        # Entries sharing a filename must still land in order (last one wins)
+        for future in self._futures.get(stem, ()):
+            future.result()
+
+        self._futures[stem] = [self._executor.submit(write_chunks, path, chunks) for path, chunks in files]
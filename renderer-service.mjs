@@ -6,6 +6,7 @@
 // Load required dependencies
 import fs from 'fs';
 import path from 'path';
+import readline from 'readline';
 import { fileURLToPath } from 'url';
 
 const __filename = fileURLToPath(import.meta.url);
@@ -224,11 +225,51 @@ class RenderingService {
         return parts.join('\n');
     }
 
+    /**
+     * List the entries renderType would process, without rendering them
+     * Each entry carries a key (data file + index) and its data file's mtime for cache validation
+     */
+    listType(entityType, options = {}) {
+        const { limit = null } = options;
+
+        const config = this.entityTypeMap[entityType];
+        if (!config) return [];
+
+        const listing = [];
+
+        for (const dataFile of config.files) {
+            const data = this.loadData(dataFile);
+            if (!data || !data[config.prop]) {
+                continue;
+            }
+
+            const sourceMtime = fs.statSync(path.join(this.dataDir, dataFile)).mtimeMs;
+            const entries = data[config.prop];
+            const entriesToProcess = limit ? entries.slice(0, limit - listing.length) : entries;
+
+            entriesToProcess.forEach((entry, index) => {
+                listing.push({
+                    key: `${dataFile}#${index}`,
+                    name: entry.name || entry._displayName || 'Unknown',
+                    source: entry.source || 'Unknown',
+                    source_mtime: sourceMtime
+                });
+            });
+
+            if (limit && listing.length >= limit) break;
+        }
+
+        return listing;
+    }
+
     /**
      * Render all entries of a specific type
      */
     renderType(entityType, options = {}) {
-        const { limit = null, saveToFile = true, silent = false } = options;
+        const { limit = null, saveToFile = true, silent = false, only = null, onResult = null } = options;
+
+        // Optional subset of entry keys (see listType) to render; the rest are skipped
+        const onlyKeys = only ? new Set(only) : null;
 
         const config = this.entityTypeMap[entityType];
         if (!config) {
@@ -239,6 +280,8 @@ class RenderingService {
         const results = [];
         let totalProcessed = 0;
 
+        if (saveToFile && onResult) this.ensureTypeDirs(entityType);
+
         for (const dataFile of config.files) {
             const data = this.loadData(dataFile);
             if (!data || !data[config.prop]) {
@@ -252,16 +295,28 @@ class RenderingService {
                 console.log(`Processing ${entriesToProcess.length} ${entityType}(s) from ${dataFile}...`);
             }
 
-            for (const entry of entriesToProcess) {
-                const markdown = this.renderEntry(entry, entityType);
+            for (const [index, entry] of entriesToProcess.entries()) {
+                const key = `${dataFile}#${index}`;
+                const markdown = onlyKeys && !onlyKeys.has(key) ? null : this.renderEntry(entry, entityType);
 
                 if (markdown) {
-                    results.push({
+                    const result = {
                         name: entry.name || entry._displayName || 'Unknown',
                         source: entry.source || 'Unknown',
                         markdown: markdown,
                         metadata: this.extractMetadata(entry, entityType, dataFile)
-                    });
+                    };
+                    if (onlyKeys) result.key = key;
+                    if (saveToFile) result.file_path = this.markdownPath(entityType, result);
+
+                    // Streaming callers get each entry as soon as it is rendered, with its files
+                    // already written so file_path is usable on arrival; results are only kept
+                    // if they are still needed for the combined file or the return value
+                    if (onResult) {
+                        if (saveToFile) this.saveEntry(entityType, result);
+                        onResult(result);
+                    }
+                    if (!onResult || saveToFile) results.push(result);
                 }
 
                 totalProcessed++;
@@ -271,60 +326,79 @@ class RenderingService {
             if (limit && totalProcessed >= limit) break;
         }
 
-        // Save to file if requested
+        // Save to file if requested (streamed entries were saved as they went)
         if (saveToFile && results.length > 0) {
-            this.saveResults(entityType, results, silent);
+            if (onResult) {
+                this.saveCombined(entityType, results, silent);
+            } else {
+                this.saveResults(entityType, results, silent);
+            }
         }
 
         return results;
     }
 
     /**
-     * Save rendered results to files
+     * Path of the markdown file saveResults writes for a result
      */
-    saveResults(entityType, results, silent = false) {
-        const typeDir = path.join(this.outputDir, entityType);
-        if (!fs.existsSync(typeDir)) {
-            fs.mkdirSync(typeDir, { recursive: true });
-        }
+    markdownPath(entityType, result) {
+        return path.join(this.outputDir, entityType, `${this.sanitizeFilename(result.name)}_${result.source}.md`);
+    }
 
-        // Save individual markdown files
-        results.forEach((result, index) => {
-            const filename = `${this.sanitizeFilename(result.name)}_${result.source}.md`;
-            const filePath = path.join(typeDir, filename);
+    /**
+     * Create the markdown and metadata directories for an entity type
+     */
+    ensureTypeDirs(entityType) {
+        fs.mkdirSync(path.join(this.outputDir, entityType), { recursive: true });
+        fs.mkdirSync(path.join(this.metadataDir, entityType), { recursive: true });
+    }
 
-            // Add minimal metadata header (just name and type)
-            const content = `---
+    /**
+     * Save one result's markdown and metadata files (directories must exist)
+     */
+    saveEntry(entityType, result) {
+        // Add minimal metadata header (just name and type)
+        const content = `---
 name: ${result.name}
 type: ${entityType}
 ---
 
 ${result.markdown}`;
 
-            fs.writeFileSync(filePath, content);
-        });
+        fs.writeFileSync(this.markdownPath(entityType, result), content);
 
-        // Save combined file
+        // Metadata goes to a separate JSON file in the metadata-output directory
+        const metaFilename = `${this.sanitizeFilename(result.name)}_${result.source}.json`;
+        const metaPath = path.join(this.metadataDir, entityType, metaFilename);
+        fs.writeFileSync(metaPath, JSON.stringify(result.metadata, null, 2));
+    }
+
+    /**
+     * Save the combined markdown file for an entity type
+     */
+    saveCombined(entityType, results, silent = false) {
+        const typeDir = path.join(this.outputDir, entityType);
         const combinedPath = path.join(typeDir, `_all_${entityType}s.md`);
         const combinedContent = results.map(r => r.markdown).join('\n\n---\n\n');
         fs.writeFileSync(combinedPath, combinedContent);
 
-        // Save metadata files as separate JSON files in metadata-output directory
-        const metadataTypeDir = path.join(this.metadataDir, entityType);
-        if (!fs.existsSync(metadataTypeDir)) {
-            fs.mkdirSync(metadataTypeDir, { recursive: true });
+        if (!silent) {
+            console.log(`✓ Saved ${results.length} ${entityType}(s) to ${typeDir}`);
+            console.log(`✓ Saved ${results.length} metadata files to ${path.join(this.metadataDir, entityType)}`);
         }
+    }
 
-        results.forEach((result) => {
-            const metaFilename = `${this.sanitizeFilename(result.name)}_${result.source}.json`;
-            const metaPath = path.join(metadataTypeDir, metaFilename);
-            fs.writeFileSync(metaPath, JSON.stringify(result.metadata, null, 2));
-        });
+    /**
+     * Save rendered results to files
+     */
+    saveResults(entityType, results, silent = false) {
+        this.ensureTypeDirs(entityType);
 
-        if (!silent) {
-            console.log(`✓ Saved ${results.length} ${entityType}(s) to ${typeDir}`);
-            console.log(`✓ Saved ${results.length} metadata files to ${metadataTypeDir}`);
+        for (const result of results) {
+            this.saveEntry(entityType, result);
         }
+
+        this.saveCombined(entityType, results, silent);
     }
 
     /**
@@ -493,12 +567,14 @@ ${result.markdown}`;
             const markdown = this.renderEntry(entry, entityType);
 
             if (markdown) {
-                results.push({
+                const result = {
                     name: entry.name || entry._displayName || 'Unknown',
                     source: entry.source || 'Unknown',
                     markdown: markdown,
                     metadata: this.extractMetadata(entry, entityType, path.basename(filePath))
-                });
+                };
+                if (saveToFile) result.file_path = this.markdownPath(entityType, result);
+                results.push(result);
             }
         }
 
@@ -572,6 +648,79 @@ ${result.markdown}`;
         });
     }
 
+    /**
+     * Serve newline-delimited JSON requests from stdin until shutdown (persistent Python worker)
+     * Each request line gets exactly one JSON response line on stdout
+     */
+    async serve() {
+        const rl = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+
+        for await (const line of rl) {
+            if (!line.trim()) continue;
+
+            let response;
+            try {
+                const request = JSON.parse(line);
+                if (request.action === 'shutdown') break;
+                if (request.stream) {
+                    this.streamRender(request);
+                    continue;
+                }
+                response = this.handleRequest(request);
+            } catch (error) {
+                response = { success: false, error: error.message };
+            }
+
+            process.stdout.write(JSON.stringify(response) + '\n');
+        }
+    }
+
+    /**
+     * Answer a streaming render request: one JSON line per rendered entry as it is produced,
+     * then a terminal {"_end": true, "success": ...} line
+     */
+    streamRender(request) {
+        const { action, type, limit, saveToFile, only } = request;
+        const write = message => process.stdout.write(JSON.stringify(message) + '\n');
+        const writeResult = result => write(this.formatResult(result, request));
+
+        try {
+            if (action !== 'render') {
+                throw new Error(`Streaming is not supported for action: ${action}`);
+            }
+            if (!type) {
+                throw new Error('Missing type parameter');
+            }
+            this.renderType(type, { limit, saveToFile, silent: true, only, onResult: writeResult });
+            write({ _end: true, success: true });
+        } catch (error) {
+            write({ _end: true, success: false, error: error.message });
+        }
+    }
+
+    /**
+     * Shape results for the wire: with format 'tuple', each result becomes
+     * [name, source, markdown, metadata, file_path] so key names aren't repeated per entry.
+     * With returnMarkdown false the markdown is left out (callers who saved to file
+     * use file_path instead)
+     */
+    formatResult(result, { format, returnMarkdown = true } = {}) {
+        const markdown = returnMarkdown === false ? null : result.markdown;
+
+        if (format === 'tuple') {
+            return [result.name, result.source, markdown, result.metadata, result.file_path ?? null];
+        }
+        if (markdown === null) {
+            const { markdown: _omitted, ...rest } = result;
+            return rest;
+        }
+        return result;
+    }
+
+    formatResults(results, options) {
+        return results.map(result => this.formatResult(result, options));
+    }
+
     /**
      * Handle requests from Python
      */
@@ -582,16 +731,29 @@ ${result.markdown}`;
             case 'summary':
                 return { success: true, data: this.getDataSummary() };
 
+            case 'list_types':
+                // Type names only; no data files are read
+                return { success: true, data: Object.keys(this.entityTypeMap) };
+
+            case 'list':
+                if (!type) {
+                    return { success: false, error: 'Missing type parameter' };
+                }
+                return { success: true, data: this.listType(type, { limit }) };
+
             case 'render':
                 if (!type) {
                     return { success: false, error: 'Missing type parameter' };
                 }
-                const results = this.renderType(type, { limit, saveToFile, silent: true });
-                return { success: true, data: results };
+                const results = this.renderType(type, { limit, saveToFile, silent: true, only: request.only });
+                return { success: true, data: this.formatResults(results, request) };
 
             case 'render_multiple':
                 const types = request.types || [];
                 const multiResults = this.renderMultipleTypes(types, { limit, saveToFile, silent: true });
+                for (const [entityType, entries] of Object.entries(multiResults)) {
+                    multiResults[entityType] = this.formatResults(entries, request);
+                }
                 return { success: true, data: multiResults };
 
             case 'render_file':
@@ -599,8 +761,20 @@ ${result.markdown}`;
                     return { success: false, error: 'Missing filePath parameter' };
                 }
                 const fileResults = this.renderFromFile(filePath, { limit, saveToFile, silent: true });
+                fileResults.results = this.formatResults(fileResults.results, request);
                 return { success: true, data: fileResults };
 
+            case 'batch':
+                // Several independent requests in one round-trip; one response per request, in order
+                const batchResults = (request.requests || []).map(subRequest => {
+                    try {
+                        return this.handleRequest(subRequest);
+                    } catch (error) {
+                        return { success: false, error: error.message };
+                    }
+                });
+                return { success: true, data: batchResults };
+
             default:
                 return { success: false, error: `Unknown action: ${action}` };
         }
@@ -619,7 +793,10 @@ const service = new RenderingService();
 const hasStdinFlag = process.argv.includes('--stdin');
 const isPiped = hasStdinFlag || process.stdin.isTTY === false;
 
-if (isPiped) {
+if (process.argv.includes('--server')) {
+    // Long-lived worker: one JSON request per line until stdin closes or shutdown
+    await service.serve();
+} else if (isPiped) {
     // Reading JSON from stdin
     await service.processStdinRequest().catch(err => {
         console.error(JSON.stringify({ success: false, error: err.message }));
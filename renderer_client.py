@@ -3,32 +3,80 @@ Python Client for 5etools Rendering Service
 Provides a Pythonic interface to render D&D rules to Markdown
 """
 
+import hashlib
 import json
 import os
+import queue
+import shutil
+import sqlite3
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Iterator, NamedTuple, Optional
 
+try:
+    import orjson
 
-@dataclass
-class RenderedEntry:
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    # orjson is optional; the stdlib codec speaks the same wire format
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+# Read buffer for the worker pipes; large enough that a big rendered entry is read in a few
+# syscalls instead of many 8 KiB ones
+_PIPE_BUFFER_SIZE = 1024 * 1024
+
+# 5etools modules the service loads, relative to its directory; together with the service
+# itself they determine the rendered output, so their hash versions the cache
+# (dnd_renderer versions its render cache the same way)
+RENDERER_MODULES = ('js/parser.js', 'js/utils.js', 'js/render.js', 'js/render-markdown.js')
+
+
+class RenderedEntry(NamedTuple):
     """Represents a rendered D&D entry"""
     name: str
     source: str
-    markdown: str
+    markdown: Optional[str]  # None when rendered with return_markdown=False
     metadata: Dict[str, Any]
+    file_path: Optional[str] = None  # Saved markdown file, when rendered with save_to_file=True
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one request sent through RenderingClient.batch"""
+    data: Any  # Response data, with rendered entries converted to RenderedEntry objects
+    error: Optional[str] = None  # Service error message if this request failed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
 
 
 class RenderingClient:
     """Python client for the Node.js rendering service"""
 
-    def __init__(self, service_path: Optional[Path] = None):
+    def __init__(
+        self,
+        service_path: Optional[Path] = None,
+        cache_path: Optional[Path] = None,
+        use_cache: bool = True
+    ):
         """
-        Initialize the rendering client
+        Initialize the rendering client and start its Node.js worker
 
         Args:
             service_path: Path to renderer-service.mjs (defaults to same directory as this file)
+            cache_path: SQLite file for rendered markdown (defaults to .render_cache/rendered.sqlite3
+                        next to this file)
+            use_cache: Whether render_type may reuse cached markdown
         """
         if service_path is None:
             service_path = Path(__file__).parent / "renderer-service.mjs"
@@ -38,6 +86,121 @@ class RenderingClient:
         if not self.service_path.exists():
             raise FileNotFoundError(f"Renderer service not found at {self.service_path}")
 
+        # Resolved once; _spawn reuses it for restarts
+        self._node_path = self._find_node()
+
+        self._cache = self._open_cache(cache_path, self._renderer_version()) if use_cache else None
+        self._types_cache: Optional[List[str]] = None
+
+        # One request/response exchange on the pipes at a time
+        self._lock = threading.Lock()
+        self._lock_owner: Optional[int] = None
+        self._proc = self._spawn()
+
+        # Extra workers for fanning render_multiple_types out across cores, started on demand
+        self._pool = queue.SimpleQueue()
+
+    def __enter__(self) -> "RenderingClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def close(self) -> None:
+        """Ask the Node.js worker to shut down and wait for it to exit"""
+        cache = getattr(self, '_cache', None)
+        if cache is not None:
+            cache.close()
+            self._cache = None
+
+        pool = getattr(self, '_pool', None)
+        while pool is not None and not pool.empty():
+            pool.get_nowait().close()
+
+        proc = getattr(self, '_proc', None)
+        if proc is None or proc.poll() is not None:
+            return
+
+        try:
+            proc.stdin.write(_dumps({'action': 'shutdown'}) + b'\n')
+            proc.stdin.close()
+        except (BrokenPipeError, ValueError):
+            pass
+        proc.wait()
+
+    def _renderer_version(self) -> str:
+        """Hash of the service script and the 5etools modules it renders with"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.service_path.read_bytes())
+        for module in RENDERER_MODULES:
+            module_path = self.service_path.parent / module
+            if module_path.exists():
+                digest.update(module_path.read_bytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _open_cache(cache_path: Optional[Path], renderer_version: str) -> sqlite3.Connection:
+        """
+        Open (creating if needed) the SQLite cache of rendered entries
+
+        Rows rendered by a different version of the renderer are dropped.
+        """
+        if cache_path is None:
+            cache_path = Path(__file__).parent / ".render_cache" / "rendered.sqlite3"
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+
+        cache = sqlite3.connect(cache_path, check_same_thread=False)
+        with cache:
+            cache.execute(
+                'CREATE TABLE IF NOT EXISTS rendered ('
+                'type TEXT, key TEXT, name TEXT, source TEXT, mtime REAL, markdown TEXT, metadata TEXT, '
+                'PRIMARY KEY (type, key))'
+            )
+            cache.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+
+            row = cache.execute("SELECT value FROM meta WHERE key = 'renderer_version'").fetchone()
+            if row is None or row[0] != renderer_version:
+                cache.execute('DELETE FROM rendered')
+                cache.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('renderer_version', ?)", (renderer_version,)
+                )
+        return cache
+
+    @staticmethod
+    def _find_node() -> str:
+        """Locate the node executable on PATH or in common locations"""
+        node_binary = shutil.which('node')
+        if node_binary:
+            return node_binary
+        if os.path.exists('/usr/local/bin/node'):
+            return '/usr/local/bin/node'
+        raise FileNotFoundError("node executable not found")
+
+    def _spawn(self) -> subprocess.Popen:
+        """Start a long-lived `renderer-service.mjs --server` worker"""
+        proc = subprocess.Popen(
+            [self._node_path, str(self.service_path), '--server'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=_PIPE_BUFFER_SIZE
+        )
+
+        # Keep draining stderr so warnings can't fill the pipe and block the worker;
+        # the tail is kept for error messages
+        proc.stderr_tail = deque(maxlen=50)
+        threading.Thread(target=self._drain_stderr, args=(proc,), daemon=True).start()
+
+        return proc
+
+    @staticmethod
+    def _drain_stderr(proc: subprocess.Popen) -> None:
+        for line in proc.stderr:
+            proc.stderr_tail.append(line)
+
     def _call_service(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Call the Node.js rendering service
@@ -48,48 +211,104 @@ class RenderingClient:
         Returns:
             Response dictionary from the service
         """
-        try:
-            # Convert request to JSON
-            request_json = json.dumps(request)
-
-            # Call Node.js service
-            # Try to find node in common locations
-            node_path = 'node'
-            import shutil
-            node_binary = shutil.which('node')
-            if node_binary:
-                node_path = node_binary
-            elif os.path.exists('/usr/local/bin/node'):
-                node_path = '/usr/local/bin/node'
-
-            result = subprocess.run(
-                [node_path, str(self.service_path), '--stdin'],
-                input=request_json,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+        with self._exclusive():
+            self._send(request)
+            response = self._read_message()
 
-            if result.returncode != 0:
-                raise RuntimeError(f"Service error: {result.stderr}")
+        if not response.get('success', False):
+            raise RuntimeError(f"Service returned error: {response.get('error', 'Unknown error')}")
 
-            # Parse response
-            if not result.stdout.strip():
-                raise RuntimeError(f"Service returned empty output. stderr: {result.stderr}")
+        return response.get('data', {})
 
-            # Debug: print what we got (uncomment for debugging)
-            # print(f"DEBUG stdout: {result.stdout[:500] if result.stdout else 'NONE'}")
-            # print(f"DEBUG stderr: {result.stderr if result.stderr else 'NONE'}")
+    def _stream_service(self, request: Dict[str, Any]) -> Iterator[Any]:
+        """
+        Call a streaming service action, yielding each result as it arrives
 
-            response = json.loads(result.stdout)
+        The worker answers with one JSON line per result followed by a terminal
+        {"_end": true, "success": ...} line. The worker is held until the iterator
+        finishes or is closed, so don't make other calls on this client meanwhile.
 
-            if not response.get('success', False):
-                raise RuntimeError(f"Service returned error: {response.get('error', 'Unknown error')}")
+        Args:
+            request: Request dictionary with action and parameters ('stream' is added)
 
-            return response.get('data', {})
+        Yields:
+            Results from the service (dicts, or lists with 'format': 'tuple')
+        """
+        with self._exclusive():
+            self._send({**request, 'stream': True})
+
+            while True:
+                message = self._read_message()
+                if self._is_end(message):
+                    break
+
+                try:
+                    yield message
+                except GeneratorExit:
+                    # Stopped early: drain the rest so the next request starts clean
+                    while not self._is_end(self._read_message()):
+                        pass
+                    raise
+
+        if not message.get('success', False):
+            raise RuntimeError(f"Service returned error: {message.get('error', 'Unknown error')}")
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """
+        Hold the worker pipes for one exchange
 
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("Service call timed out")
+        A streaming iterator keeps them held between entries; a call from the same thread
+        while one is open raises instead of waiting on itself forever.
+        """
+        if self._lock_owner == threading.get_ident():
+            raise RuntimeError(
+                "RenderingClient is busy with an unfinished render_type_iter; "
+                "finish or close it before making other calls"
+            )
+
+        with self._lock:
+            self._lock_owner = threading.get_ident()
+            try:
+                yield
+            finally:
+                self._lock_owner = None
+
+    @staticmethod
+    def _check_return_markdown(save_to_file: bool, return_markdown: bool) -> None:
+        """Reject renders that would return entries with neither markdown nor a saved file"""
+        if not return_markdown and not save_to_file:
+            raise ValueError("return_markdown=False requires save_to_file=True")
+
+    @staticmethod
+    def _is_end(message: Any) -> bool:
+        """Whether a streamed line is the terminal message (results may be dicts or tuples)"""
+        return isinstance(message, dict) and bool(message.get('_end'))
+
+    def _send(self, request: Dict[str, Any]) -> None:
+        """Write one request line to the worker (caller holds the lock)"""
+        # Restart the worker if a previous call killed it
+        if self._proc.poll() is not None:
+            self._proc = self._spawn()
+
+        try:
+            self._proc.stdin.write(_dumps(request) + b'\n')
+            self._proc.stdin.flush()
+        except BrokenPipeError:
+            pass  # Reported by _read_message, with the worker's stderr
+
+    def _read_message(self) -> Dict[str, Any]:
+        """Read and parse one JSON line from the worker (caller holds the lock)"""
+        line = self._proc.stdout.readline()
+
+        if not line:
+            self._proc.wait()
+            stderr = b''.join(self._proc.stderr_tail).decode(errors='replace')
+            raise RuntimeError(f"Service error: {stderr}")
+
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so this covers both codecs
+        try:
+            return _loads(line)
         except json.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse service response: {e}")
 
@@ -100,14 +319,14 @@ class RenderingClient:
         Returns:
             Dictionary mapping entity types to their metadata
         """
-        request = {'action': 'summary'}
-        return self._call_service(request)
+        return self._call_service(self.summary_request())
 
     def render_type(
         self,
         entity_type: str,
         limit: Optional[int] = None,
-        save_to_file: bool = True
+        save_to_file: bool = True,
+        return_markdown: bool = True
     ) -> List[RenderedEntry]:
         """
         Render all entries of a specific type
@@ -116,34 +335,128 @@ class RenderingClient:
             entity_type: Type of entity (spell, item, monster, etc.)
             limit: Maximum number of entries to render (None for all)
             save_to_file: Whether to save results to markdown files
+            return_markdown: Whether to send the markdown back (False leaves markdown None and
+                             requires save_to_file; use file_path instead)
 
         Returns:
             List of RenderedEntry objects
         """
-        request = {
-            'action': 'render',
-            'type': entity_type,
-            'limit': limit,
-            'saveToFile': save_to_file
-        }
+        return list(self.render_type_iter(entity_type, limit, save_to_file, return_markdown))
 
-        results = self._call_service(request)
+    def render_type_iter(
+        self,
+        entity_type: str,
+        limit: Optional[int] = None,
+        save_to_file: bool = True,
+        return_markdown: bool = True
+    ) -> Iterator[RenderedEntry]:
+        """
+        Render all entries of a specific type, yielding each one as soon as it is rendered
 
-        return [
-            RenderedEntry(
-                name=entry['name'],
-                source=entry['source'],
-                markdown=entry['markdown'],
-                metadata=entry['metadata']
+        Entries are streamed from the worker one JSON line at a time, so only the current
+        entry is held in memory. Finish or close the iterator before making other calls
+        on this client.
+
+        Args:
+            entity_type: Type of entity (spell, item, monster, etc.)
+            limit: Maximum number of entries to render (None for all)
+            save_to_file: Whether to save results to markdown files
+            return_markdown: Whether to send the markdown back (False leaves markdown None and
+                             requires save_to_file; use file_path instead)
+
+        Returns:
+            Iterator of RenderedEntry objects, in data file order. With save_to_file, each
+            entry's files are written before it is yielded
+        """
+        self._check_return_markdown(save_to_file, return_markdown)
+        return self._render_type_iter(entity_type, limit, save_to_file, return_markdown)
+
+    def _render_type_iter(
+        self,
+        entity_type: str,
+        limit: Optional[int],
+        save_to_file: bool,
+        return_markdown: bool
+    ) -> Iterator[RenderedEntry]:
+        """Generator behind render_type_iter, so argument errors raise at call time"""
+        # Saving needs every entry rendered by Node, so only in-memory renders use the cache
+        if self._cache is not None and not save_to_file:
+            yield from self._render_type_cached(entity_type, limit)
+            return
+
+        request = self.render_type_request(entity_type, limit, save_to_file, return_markdown)
+
+        yield from map(RenderedEntry._make, self._stream_service(request))
+
+    def _render_type_cached(self, entity_type: str, limit: Optional[int]) -> List[RenderedEntry]:
+        """
+        Render a type, reusing cached markdown for entries whose data file is unchanged
+
+        A cached entry is valid while its name, source and the mtime of the data file it
+        came from all match the current listing; everything else is rendered in one request.
+        """
+        listing = self._call_service({'action': 'list', 'type': entity_type, 'limit': limit})
+
+        cached = {
+            key: (name, source, mtime, markdown, metadata)
+            for key, name, source, mtime, markdown, metadata in self._cache.execute(
+                'SELECT key, name, source, mtime, markdown, metadata FROM rendered WHERE type = ?',
+                (entity_type,)
             )
-            for entry in results
+        }
+
+        missing = [
+            item['key'] for item in listing
+            if cached.get(item['key'], ())[:3] != (item['name'], item['source'], item['source_mtime'])
         ]
+        missing_set = set(missing)
+
+        rendered = {}
+        if missing:
+            results = self._call_service({
+                'action': 'render',
+                'type': entity_type,
+                'limit': limit,
+                'saveToFile': False,
+                'only': missing
+            })
+            rendered = {result['key']: result for result in results}
+
+            mtimes = {item['key']: item['source_mtime'] for item in listing}
+            with self._cache:
+                self._cache.executemany(
+                    'INSERT OR REPLACE INTO rendered VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    [
+                        (entity_type, key, result['name'], result['source'], mtimes[key],
+                         result['markdown'], _dumps(result['metadata']))
+                        for key, result in rendered.items()
+                    ]
+                )
+
+        entries = []
+        for item in listing:
+            key = item['key']
+            if key in rendered:
+                result = rendered[key]
+                entries.append(RenderedEntry(result['name'], result['source'], result['markdown'], result['metadata']))
+            elif key in cached and key not in missing_set:
+                name, source, _, markdown, metadata = cached[key]
+                entries.append(RenderedEntry(name, source, markdown, _loads(metadata)))
+
+        return entries
+
+    def clear_cache(self) -> None:
+        """Drop every cached rendered entry"""
+        if self._cache is not None:
+            with self._cache:
+                self._cache.execute('DELETE FROM rendered')
 
     def render_multiple_types(
         self,
         entity_types: List[str],
         limit: Optional[int] = None,
-        save_to_file: bool = True
+        save_to_file: bool = True,
+        return_markdown: bool = True
     ) -> Dict[str, List[RenderedEntry]]:
         """
         Render multiple entity types at once
@@ -152,37 +465,57 @@ class RenderingClient:
             entity_types: List of entity types to render
             limit: Maximum number of entries per type (None for all)
             save_to_file: Whether to save results to markdown files
+            return_markdown: Whether to send the markdown back (False leaves markdown None and
+                             requires save_to_file; use file_path instead)
 
         Returns:
             Dictionary mapping entity types to lists of RenderedEntry objects
         """
-        request = {
-            'action': 'render_multiple',
-            'types': entity_types,
-            'limit': limit,
-            'saveToFile': save_to_file
-        }
+        self._check_return_markdown(save_to_file, return_markdown)
+
+        # Each type renders independently, so give every type its own Node worker
+        if len(entity_types) > 1:
+            workers = min(len(entity_types), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._call_one_worker,
+                        self.render_type_request(entity_type, limit, save_to_file, return_markdown)
+                    )
+                    for entity_type in entity_types
+                ]
+                return {
+                    entity_type: self._to_entries(future.result())
+                    for entity_type, future in zip(entity_types, futures)
+                }
+
+        request = self.render_multiple_types_request(entity_types, limit, save_to_file, return_markdown)
 
         results = self._call_service(request)
 
         return {
-            entity_type: [
-                RenderedEntry(
-                    name=entry['name'],
-                    source=entry['source'],
-                    markdown=entry['markdown'],
-                    metadata=entry['metadata']
-                )
-                for entry in entries
-            ]
+            entity_type: self._to_entries(entries)
             for entity_type, entries in results.items()
         }
 
+    def _call_one_worker(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one request on an idle pool worker, starting a new one if none is free"""
+        try:
+            worker = self._pool.get_nowait()
+        except queue.Empty:
+            worker = RenderingClient(self.service_path, use_cache=False)
+
+        try:
+            return worker._call_service(request)
+        finally:
+            self._pool.put(worker)
+
     def render_from_file(
         self,
         file_path: str,
         limit: Optional[int] = None,
-        save_to_file: bool = True
+        save_to_file: bool = True,
+        return_markdown: bool = True
     ) -> Dict[str, Any]:
         """
         Render entries from a specific JSON file (e.g., curated rules)
@@ -191,16 +524,15 @@ class RenderingClient:
             file_path: Path to the JSON file
             limit: Maximum number of entries to render (None for all)
             save_to_file: Whether to save results to markdown files
+            return_markdown: Whether to send the markdown back (False leaves markdown None and
+                             requires save_to_file; use file_path instead)
 
         Returns:
             Dictionary with 'entityType' and 'results' (list of RenderedEntry objects)
         """
-        request = {
-            'action': 'render_file',
-            'filePath': file_path,
-            'limit': limit,
-            'saveToFile': save_to_file
-        }
+        self._check_return_markdown(save_to_file, return_markdown)
+
+        request = self.render_from_file_request(file_path, limit, save_to_file, return_markdown)
 
         result = self._call_service(request)
 
@@ -209,69 +541,185 @@ class RenderingClient:
 
         return {
             'entityType': entity_type,
-            'results': [
-                RenderedEntry(
-                    name=entry['name'],
-                    source=entry['source'],
-                    markdown=entry['markdown'],
-                    metadata=entry['metadata']
-                )
-                for entry in entries
-            ]
+            'results': self._to_entries(entries)
         }
 
-    def get_available_types(self) -> List[str]:
+    def get_available_types(self, summary: Optional[Dict[str, Dict[str, Any]]] = None) -> List[str]:
         """
         Get list of all available entity types
 
+        The list is fetched once with a cheap 'list_types' request and reused afterwards.
+
+        Args:
+            summary: Result of an earlier get_data_summary() call, to avoid another request
+
         Returns:
             List of entity type names
         """
-        summary = self.get_data_summary()
-        return list(summary.keys())
+        if summary is not None:
+            return list(summary.keys())
+        if self._types_cache is None:
+            self._types_cache = self._call_service({'action': 'list_types'})
+        return list(self._types_cache)
+
+    @staticmethod
+    def summary_request() -> Dict[str, Any]:
+        """Request for get_data_summary(), for use with batch()"""
+        return {'action': 'summary'}
+
+    @classmethod
+    def render_type_request(
+        cls,
+        entity_type: str,
+        limit: Optional[int] = None,
+        save_to_file: bool = True,
+        return_markdown: bool = True
+    ) -> Dict[str, Any]:
+        """Request for render_type(), for use with batch(); arguments as for render_type"""
+        cls._check_return_markdown(save_to_file, return_markdown)
+        return {
+            'action': 'render',
+            'type': entity_type,
+            'limit': limit,
+            'saveToFile': save_to_file,
+            'returnMarkdown': return_markdown,
+            'format': 'tuple'
+        }
 
+    @classmethod
+    def render_multiple_types_request(
+        cls,
+        entity_types: List[str],
+        limit: Optional[int] = None,
+        save_to_file: bool = True,
+        return_markdown: bool = True
+    ) -> Dict[str, Any]:
+        """Request for render_multiple_types(), for use with batch(); rendered on one worker"""
+        cls._check_return_markdown(save_to_file, return_markdown)
+        return {
+            'action': 'render_multiple',
+            'types': entity_types,
+            'limit': limit,
+            'saveToFile': save_to_file,
+            'returnMarkdown': return_markdown,
+            'format': 'tuple'
+        }
+
+    @classmethod
+    def render_from_file_request(
+        cls,
+        file_path: str,
+        limit: Optional[int] = None,
+        save_to_file: bool = True,
+        return_markdown: bool = True
+    ) -> Dict[str, Any]:
+        """Request for render_from_file(), for use with batch(); arguments as for render_from_file"""
+        cls._check_return_markdown(save_to_file, return_markdown)
+        return {
+            'action': 'render_file',
+            'filePath': file_path,
+            'limit': limit,
+            'saveToFile': save_to_file,
+            'returnMarkdown': return_markdown,
+            'format': 'tuple'
+        }
+
+    def batch(self, requests: List[Dict[str, Any]]) -> List[BatchResult]:
+        """
+        Send several service requests in a single round-trip
+
+        Build requests with summary_request(), render_type_request(),
+        render_multiple_types_request() or render_from_file_request(). A failing
+        request doesn't affect the others; check each result's ok/error.
+
+        Args:
+            requests: Request dictionaries
+
+        Returns:
+            One BatchResult per request, in request order. Render results hold the same
+            types the matching methods return (lists/dicts of RenderedEntry objects)
+        """
+        responses = self._call_service({'action': 'batch', 'requests': requests})
+
+        return [
+            BatchResult(self._convert_data(request.get('action'), response.get('data', {})))
+            if response.get('success', False)
+            else BatchResult(None, response.get('error', 'Unknown error'))
+            for request, response in zip(requests, responses)
+        ]
+
+    @classmethod
+    def _convert_data(cls, action: Optional[str], data: Any) -> Any:
+        """Turn the raw data of a response into the types the public methods return"""
+        if action == 'render':
+            return cls._to_entries(data)
+        if action == 'render_multiple':
+            return {entity_type: cls._to_entries(entries) for entity_type, entries in data.items()}
+        if action == 'render_file':
+            return {'entityType': data.get('entityType'), 'results': cls._to_entries(data.get('results', []))}
+        return data
+
+    @staticmethod
+    def _to_entries(results: List[Any]) -> List[RenderedEntry]:
+        """
+        Convert raw service results into RenderedEntry objects
+
+        Results requested with 'format': 'tuple' are built positionally; plain result
+        objects are accepted too.
+        """
+        if results and isinstance(results[0], dict):
+            return [
+                RenderedEntry(
+                    entry['name'], entry['source'], entry.get('markdown'), entry['metadata'],
+                    entry.get('file_path')
+                )
+                for entry in results
+            ]
+        return list(map(RenderedEntry._make, results))
 
 def main():
     """Demo usage of the rendering client"""
     print("=== 5etools Python Rendering Client ===\n")
 
     # Initialize client
-    client = RenderingClient()
-
-    # Get data summary
-    print("📊 Available Data:")
-    summary = client.get_data_summary()
-    for entity_type, info in sorted(summary.items()):
-        print(f"  - {entity_type}: {info['count']} entries")
-
-    print("\n🔨 Rendering Sample Entries...\n")
-
-    # Render a few spells
-    print("Rendering 3 spells...")
-    spells = client.render_type('spell', limit=3, save_to_file=True)
-
-    for spell in spells:
-        print(f"\n{'='*60}")
-        print(f"Name: {spell.name}")
-        print(f"Source: {spell.source}")
-        print(f"Type: {spell.metadata['type']}")
-        print(f"\nMarkdown Preview (first 200 chars):")
-        print(spell.markdown[:200] + "...")
-
-    print("\n" + "="*60)
-
-    # Render multiple types at once
-    print("\n🚀 Rendering multiple types...")
-    results = client.render_multiple_types(
-        entity_types=['action', 'item', 'monster'],
-        limit=2,
-        save_to_file=True
-    )
-
-    for entity_type, entries in results.items():
-        print(f"\n✓ Rendered {len(entries)} {entity_type}(s)")
-        for entry in entries:
-            print(f"  - {entry.name} ({entry.source})")
+    with RenderingClient() as client:
+        print("🔨 Fetching the data summary and rendering sample entries in one round-trip...")
+
+        # Only names are printed for the multi-type render, so leave that markdown on disk
+        summary, spells, multi = client.batch([
+            client.summary_request(),
+            client.render_type_request('spell', limit=3),
+            client.render_multiple_types_request(['action', 'item', 'monster'], limit=2, return_markdown=False),
+        ])
+
+        if summary.ok:
+            print("\n📊 Available Data:")
+            for entity_type, info in sorted(summary.data.items()):
+                print(f"  - {entity_type}: {info['count']} entries")
+        else:
+            print(f"\n❌ Summary failed: {summary.error}")
+
+        if spells.ok:
+            print(f"\nRendered {len(spells.data)} spells:")
+            for spell in spells.data:
+                print(f"\n{'='*60}")
+                print(f"Name: {spell.name}")
+                print(f"Source: {spell.source}")
+                print(f"Type: {spell.metadata['type']}")
+                print(f"\nMarkdown Preview (first 200 chars):")
+                print(spell.markdown[:200] + "...")
+
+            print("\n" + "="*60)
+        else:
+            print(f"\n❌ Spell render failed: {spells.error}")
+
+        if multi.ok:
+            for entity_type, entries in multi.data.items():
+                print(f"\n✓ Rendered {len(entries)} {entity_type}(s)")
+                for entry in entries:
+                    print(f"  - {entry.name} ({entry.source})")
+        else:
+            print(f"\n❌ Multi-type render failed: {multi.error}")
 
     print("\n✅ Done! Check the markdown-output/ directory for results.")
 